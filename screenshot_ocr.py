@@ -10,6 +10,7 @@ import tkinter as tk
 from PIL import Image, ImageGrab
 import pyperclip
 import ctypes
+import gc
 import logging
 from datetime import datetime
 
@@ -144,6 +145,117 @@ BASE_URL = "https://dashscope.aliyuncs.com/compatible-mode/v1"
 MODEL_NAME = "qwen3-vl-plus"
 
 
+# 配置读取：从 config.json 读取内存上限（MB），0 表示不限制
+DEFAULT_MAX_RSS_MB = 500
+# 内存上限的最小值：低于 Python + Tk + PIL + openai 的基础占用会导致每次截图都重启
+MIN_MAX_RSS_MB = 150
+
+
+def validate_max_rss_mb(value, source):
+    """校验内存上限配置，非法值记录警告并回退到默认值"""
+    if isinstance(value, bool) or not isinstance(value, int):
+        logger.warning(
+            f"{source}中的内存上限 {value!r} 不是整数，使用默认值 {DEFAULT_MAX_RSS_MB} MB"
+        )
+        return DEFAULT_MAX_RSS_MB
+    if value == 0:
+        return 0
+    if value < MIN_MAX_RSS_MB:
+        logger.warning(
+            f"{source}中的内存上限 {value} MB 低于最小值 {MIN_MAX_RSS_MB} MB，"
+            f"使用默认值 {DEFAULT_MAX_RSS_MB} MB"
+        )
+        return DEFAULT_MAX_RSS_MB
+    return value
+
+
+def load_max_rss_mb():
+    config_path = os.path.join(os.path.dirname(__file__), "config.json")
+    try:
+        with open(config_path, "r", encoding="utf-8") as f:
+            cfg = json.load(f)
+            if "MAX_RSS_MB" in cfg:
+                value = validate_max_rss_mb(cfg["MAX_RSS_MB"], "配置文件")
+                logger.info(f"从配置文件加载内存上限: {value} MB")
+                return value
+    except Exception as e:
+        logger.warning(f"从配置文件加载内存上限失败: {e}")
+    return DEFAULT_MAX_RSS_MB
+
+
+MAX_RSS_MB = load_max_rss_mb()
+
+# JPEG编码缓冲区在多次截图之间复用，避免每次重新扩容；
+# base64字符串和data URL仍会在每次截图时各分配一份
+_encode_buffer = io.BytesIO()
+# 编码后缓冲区超过此大小则替换为新缓冲区，避免长期占用最大一次截图的内存
+ENCODE_BUFFER_MAX_BYTES = 1024 * 1024
+
+_openai_client = None
+
+# 首次截图后的内存占用作为基础占用，用于判断上限是否可行
+_baseline_checked = False
+
+
+def get_openai_client():
+    """获取复用的OpenAI客户端（新版API v1.0+），首次调用时创建"""
+    global _openai_client
+    if _openai_client is None:
+        from openai import OpenAI
+
+        _openai_client = OpenAI(api_key=API_KEY, base_url=BASE_URL)
+    return _openai_client
+
+
+class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+    _fields_ = [
+        ("cb", ctypes.c_ulong),
+        ("PageFaultCount", ctypes.c_ulong),
+        ("PeakWorkingSetSize", ctypes.c_size_t),
+        ("WorkingSetSize", ctypes.c_size_t),
+        ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+        ("QuotaPagedPoolUsage", ctypes.c_size_t),
+        ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+        ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+        ("PagefileUsage", ctypes.c_size_t),
+        ("PeakPagefileUsage", ctypes.c_size_t),
+    ]
+
+
+# 进程内存查询的函数原型（Windows），非Windows平台回退到 /proc
+try:
+    _kernel32 = ctypes.windll.kernel32
+    _psapi = ctypes.windll.psapi
+    _kernel32.GetCurrentProcess.restype = ctypes.c_void_p
+    _psapi.GetProcessMemoryInfo.argtypes = [
+        ctypes.c_void_p,
+        ctypes.POINTER(PROCESS_MEMORY_COUNTERS),
+        ctypes.c_ulong,
+    ]
+except Exception:
+    _kernel32 = None
+    _psapi = None
+
+
+def get_process_rss():
+    """获取当前进程的常驻内存（字节），获取失败返回None"""
+    try:
+        if _psapi is not None:
+            counters = PROCESS_MEMORY_COUNTERS()
+            counters.cb = ctypes.sizeof(counters)
+            if _psapi.GetProcessMemoryInfo(
+                _kernel32.GetCurrentProcess(), ctypes.byref(counters), counters.cb
+            ):
+                return counters.WorkingSetSize
+            return None
+
+        with open("/proc/self/statm", "r") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except Exception as e:
+        logger.warning(f"获取进程内存占用失败: {e}")
+        return None
+
+
 class ScreenshotTool:
     def __init__(self):
         self.root = tk.Tk()
@@ -204,16 +316,37 @@ class ScreenshotTool:
     def take_screenshot(self, x1, y1, x2, y2):
         # 截取选定区域
         img = ImageGrab.grab(bbox=(x1, y1, x2, y2), all_screens=True)
-        self.process_image(img)
+        try:
+            self.process_image(img)
+        finally:
+            # 显式释放图片占用的内存
+            img.close()
 
     def process_image(self, img):
-        # 将图片转换为base64
-        buffered = io.BytesIO()
-        img.save(buffered, format="JPEG")
-        img_base64 = base64.b64encode(buffered.getvalue()).decode("utf-8")
+        global _encode_buffer
+
+        # 将图片转换为base64（复用编码缓冲区，只读取本次图片的有效长度）
+        _encode_buffer.seek(0)
+        img.save(_encode_buffer, format="JPEG")
+        size = _encode_buffer.tell()
+        with _encode_buffer.getbuffer() as view, view[:size] as data:
+            img_base64 = base64.b64encode(data).decode("ascii")
+        if size > ENCODE_BUFFER_MAX_BYTES:
+            # 大截图后释放缓冲区，下次从小缓冲区重新开始
+            _encode_buffer = io.BytesIO()
 
         self.call_ocr_api(img_base64)
 
+    def release(self):
+        """释放Tk窗口及画布资源"""
+        try:
+            self.root.destroy()
+        except tk.TclError:
+            pass  # 窗口已在回调中销毁
+        self.canvas = None
+        self.rect = None
+        self.root = None
+
     def call_ocr_api(self, img_base64):
         import json  # 确保json模块在函数作用域内
 
@@ -228,10 +361,7 @@ class ScreenshotTool:
         try:
             logger.info(f"使用OpenAI兼容模式调用API: {BASE_URL}")
             logger.info(f"使用模型: {MODEL_NAME}")
-            from openai import OpenAI
-
-            # 初始化OpenAI客户端（新版API v1.0+）
-            client = OpenAI(api_key=API_KEY, base_url=BASE_URL)
+            client = get_openai_client()
 
             logger.info("开始发送API请求...")
             # 使用新版ChatCompletion API
@@ -408,7 +538,57 @@ class ScreenshotTool:
 
 def take_screenshot_hotkey():
     tool = ScreenshotTool()
-    tool.root.mainloop()
+    try:
+        tool.root.mainloop()
+    finally:
+        tool.release()
+        del tool
+        # 回收Tk回调等产生的循环引用，再检查内存上限
+        gc.collect()
+        check_memory_limit()
+
+
+def check_memory_limit():
+    """检查进程内存占用，超过上限时自动重启"""
+    global MAX_RSS_MB, _baseline_checked
+
+    if MAX_RSS_MB <= 0:
+        return
+    rss = get_process_rss()
+    if rss is None:
+        return
+    rss_mb = rss / (1024 * 1024)
+    logger.info(f"当前进程内存占用: {rss_mb:.1f} MB（上限 {MAX_RSS_MB} MB）")
+
+    if not _baseline_checked:
+        # 首次截图后Tk、截图和API客户端都已加载，此时已超过上限说明上限过低，
+        # 重启也无法降到上限以下，禁用上限避免每次截图都重启
+        _baseline_checked = True
+        if rss_mb >= MAX_RSS_MB:
+            logger.warning(
+                f"首次截图后内存占用 {rss_mb:.1f} MB 已超过上限 {MAX_RSS_MB} MB，"
+                "本次运行禁用自动重启"
+            )
+            MAX_RSS_MB = 0
+        return
+
+    if rss_mb > MAX_RSS_MB:
+        logger.warning(f"内存占用 {rss_mb:.1f} MB 超过上限 {MAX_RSS_MB} MB，准备重启")
+        restart_self()
+
+
+def restart_self():
+    """以相同命令行参数启动新进程，并退出当前进程"""
+    try:
+        script_path = get_script_path()
+        cmd = [get_python_executable(), script_path] + sys.argv[1:]
+        logger.info(f"重启命令: {cmd}")
+        subprocess.Popen(cmd, cwd=os.path.dirname(script_path) or None)
+    except Exception as e:
+        logger.error(f"自动重启失败，继续运行当前进程: {e}", exc_info=True)
+        return
+    logging.shutdown()
+    os._exit(0)
 
 
 def quit_app():
@@ -579,6 +759,8 @@ def check_startup_status():
 
 
 def main():
+    global MAX_RSS_MB
+
     # 解析命令行参数
     parser = argparse.ArgumentParser(
         description="屏幕截图OCR工具 - 自动识别截图中的文字"
@@ -597,9 +779,19 @@ def main():
         "--no-delay", action="store_true", help="不延迟启动（默认延迟1秒）"
     )
     parser.add_argument("--delay", type=int, default=1, help="启动延迟秒数（默认1秒）")
+    parser.add_argument(
+        "--max-rss-mb",
+        type=int,
+        default=None,
+        help=f"内存上限（MB），超过后自动重启，0表示不限制"
+        f"（默认{DEFAULT_MAX_RSS_MB}，最小{MIN_MAX_RSS_MB}）",
+    )
 
     args = parser.parse_args()
 
+    if args.max_rss_mb is not None:
+        MAX_RSS_MB = validate_max_rss_mb(args.max_rss_mb, "命令行参数")
+
     # 处理开机启动相关参数
     if args.enable_autostart:
         if create_startup_shortcut():
@@ -635,6 +827,11 @@ def main():
     print("  python screenshot_ocr.py --check-autostart   # 检查启动状态")
     print("\n程序已隐藏到后台运行...")
 
+    if MAX_RSS_MB > 0:
+        logger.info(f"内存上限: {MAX_RSS_MB} MB，超过后自动重启")
+    else:
+        logger.info("内存上限未启用")
+
     # 延迟启动功能（默认1秒，可通过--no-disable或--delay参数控制）
     if not args.no_delay and args.delay > 0:
         delay_seconds = args.delay
@@ -0,0 +1,141 @@
+"""测试夹具：用桩模块替代 tkinter、PIL、openai 等依赖后导入 screenshot_ocr"""
+
+import importlib
+import logging
+import os
+import subprocess
+import sys
+import types
+from unittest import mock
+
+import pytest
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class FakeTclError(Exception):
+    pass
+
+
+class FakeEvent:
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+
+class FakeTk:
+    """模拟 tk.Tk：mainloop 时在画布上完成一次框选"""
+
+    def __init__(self):
+        self.tk = self
+        self.canvas = None
+        self.destroyed = False
+
+    def attributes(self, *args):
+        pass
+
+    def config(self, **kwargs):
+        pass
+
+    def call(self, *args):
+        pass
+
+    def bind(self, sequence, func):
+        pass
+
+    def mainloop(self):
+        self.canvas.bindings["<ButtonPress-1>"](FakeEvent(10, 10))
+        self.canvas.bindings["<B1-Motion>"](FakeEvent(100, 80))
+        self.canvas.bindings["<ButtonRelease-1>"](FakeEvent(210, 160))
+
+    def destroy(self):
+        if self.destroyed:
+            raise FakeTclError("application has been destroyed")
+        self.destroyed = True
+
+
+class FakeCanvas:
+    def __init__(self, master, **kwargs):
+        master.canvas = self
+        self.bindings = {}
+
+    def pack(self, **kwargs):
+        pass
+
+    def bind(self, sequence, func):
+        self.bindings[sequence] = func
+
+    def create_rectangle(self, *args, **kwargs):
+        return 1
+
+    def coords(self, *args):
+        pass
+
+
+class FakeImage:
+    """模拟 PIL 图片：保存时写入与截图区域成比例的字节"""
+
+    def __init__(self, size):
+        self.size = size
+        self.closed = False
+
+    def save(self, fp, format):
+        fp.write(b"\xff" * self.size)
+
+    def close(self):
+        self.closed = True
+
+
+def fake_grab(bbox, all_screens=False):
+    x1, y1, x2, y2 = bbox
+    return FakeImage((x2 - x1) * (y2 - y1))
+
+
+def make_stub_modules():
+    tkinter = types.ModuleType("tkinter")
+    tkinter.Tk = FakeTk
+    tkinter.Canvas = FakeCanvas
+    tkinter.TclError = FakeTclError
+
+    image_grab = types.ModuleType("PIL.ImageGrab")
+    image_grab.grab = fake_grab
+    pil = types.ModuleType("PIL")
+    pil.Image = types.ModuleType("PIL.Image")
+    pil.ImageGrab = image_grab
+
+    pyperclip = types.ModuleType("pyperclip")
+    pyperclip.copy = lambda text: None
+
+    openai = types.ModuleType("openai")
+    openai.__version__ = "1.0.0"
+    openai.OpenAI = None  # 由各测试替换为所需的假客户端
+
+    return {
+        "tkinter": tkinter,
+        "PIL": pil,
+        "PIL.Image": pil.Image,
+        "PIL.ImageGrab": image_grab,
+        "pyperclip": pyperclip,
+        "keyboard": types.ModuleType("keyboard"),
+        "openai": openai,
+    }
+
+
+@pytest.fixture(scope="module")
+def screenshot_ocr():
+    """导入 screenshot_ocr；模块测试结束后恢复 sys.modules、sys.path 和根日志配置"""
+    root = logging.getLogger()
+    saved_handlers, saved_level = root.handlers[:], root.level
+
+    with mock.patch.dict(sys.modules, make_stub_modules()), mock.patch.object(
+        sys, "path", [REPO_DIR] + sys.path
+    ):
+        # 导入时的依赖检查不应真的调用 pip，日志也不写入 logs/ 目录
+        with mock.patch.object(subprocess, "check_call"), mock.patch.object(
+            logging, "FileHandler", lambda *args, **kwargs: logging.NullHandler()
+        ):
+            module = importlib.import_module("screenshot_ocr")
+        yield module
+
+    root.handlers[:] = saved_handlers
+    root.setLevel(saved_level)
@@ -0,0 +1,268 @@
+"""常驻进程内存测试：大量模拟截图后内存应保持平稳"""
+
+import gc
+import os
+import sys
+import tracemalloc
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+
+from conftest import FakeImage, fake_grab
+
+COMPLETION = SimpleNamespace(
+    choices=[SimpleNamespace(message=SimpleNamespace(content=" 识别结果 "))]
+)
+
+
+class FakeOpenAI:
+    """假客户端：返回固定响应，只记录创建次数，不保留每次调用"""
+
+    instances = 0
+
+    def __init__(self, api_key, base_url):
+        type(self).instances += 1
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    def create(self, **kwargs):
+        return COMPLETION
+
+
+class Counter:
+    """只计数，不保留参数，避免测试本身造成内存增长"""
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, *args, **kwargs):
+        self.count += 1
+
+
+@pytest.fixture
+def fake_api(screenshot_ocr, monkeypatch):
+    """走真实的 call_ocr_api，但使用假 OpenAI 客户端和剪贴板"""
+    monkeypatch.setattr(FakeOpenAI, "instances", 0)
+    monkeypatch.setattr(sys.modules["openai"], "OpenAI", FakeOpenAI)
+    monkeypatch.setattr(screenshot_ocr, "_openai_client", None, raising=False)
+    monkeypatch.setattr(screenshot_ocr, "API_KEY", "sk-test")
+    monkeypatch.setattr(screenshot_ocr, "MAX_RSS_MB", 0)
+
+    copy = Counter()
+    monkeypatch.setattr(screenshot_ocr.pyperclip, "copy", copy)
+    # 日志和控制台输出会被 pytest 捕获并累积，不计入被测代码的内存
+    monkeypatch.setattr(screenshot_ocr.logger, "disabled", True)
+    monkeypatch.setattr(screenshot_ocr, "print", lambda *args: None, raising=False)
+    return copy
+
+
+@pytest.fixture
+def no_ocr(screenshot_ocr, monkeypatch):
+    calls = Counter()
+    monkeypatch.setattr(
+        screenshot_ocr.ScreenshotTool,
+        "call_ocr_api",
+        lambda self, img_base64: calls(img_base64),
+    )
+    monkeypatch.setattr(screenshot_ocr, "MAX_RSS_MB", 0)
+    return calls
+
+
+def measure_growth(capture, warmup, runs):
+    tracemalloc.start()
+    try:
+        capture(warmup)
+        gc.collect()
+        before = tracemalloc.take_snapshot()
+
+        capture(runs)
+        gc.collect()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    return sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+
+
+def test_hotkey_capture_soak_memory_flat(screenshot_ocr, fake_api):
+    def capture(n):
+        for _ in range(n):
+            screenshot_ocr.take_screenshot_hotkey()
+
+    growth = measure_growth(capture, warmup=50, runs=500)
+
+    assert fake_api.count == 550
+    assert FakeOpenAI.instances == 1
+    assert growth < 8 * 1024
+
+
+def test_process_image_soak_memory_flat(screenshot_ocr, fake_api):
+    def capture(n):
+        for i in range(n):
+            tool = screenshot_ocr.ScreenshotTool()
+            img = FakeImage(1000 + (i % 50) * 100)
+            tool.process_image(img)
+            img.close()
+            tool.release()
+
+    growth = measure_growth(capture, warmup=50, runs=2000)
+
+    assert fake_api.count == 2050
+    assert FakeOpenAI.instances == 1
+    assert growth < 8 * 1024
+
+
+def test_get_openai_client_reused(screenshot_ocr, fake_api):
+    client = screenshot_ocr.get_openai_client()
+
+    assert screenshot_ocr.get_openai_client() is client
+    assert FakeOpenAI.instances == 1
+
+
+def test_take_screenshot_closes_image(screenshot_ocr, no_ocr, monkeypatch):
+    images = []
+
+    def grab(bbox, all_screens=False):
+        images.append(fake_grab(bbox))
+        return images[-1]
+
+    monkeypatch.setattr(screenshot_ocr.ImageGrab, "grab", grab)
+    screenshot_ocr.take_screenshot_hotkey()
+
+    assert len(images) == 1
+    assert images[0].closed
+
+
+def test_release_after_destroy(screenshot_ocr):
+    tool = screenshot_ocr.ScreenshotTool()
+    tool.root.destroy()
+    tool.release()
+
+    assert tool.root is None
+    assert tool.canvas is None
+
+
+def test_large_capture_drops_encode_buffer(screenshot_ocr, no_ocr):
+    tool = screenshot_ocr.ScreenshotTool()
+    tool.process_image(FakeImage(screenshot_ocr.ENCODE_BUFFER_MAX_BYTES + 1))
+    assert screenshot_ocr._encode_buffer.getbuffer().nbytes == 0
+
+    tool.process_image(FakeImage(1000))
+    assert screenshot_ocr._encode_buffer.getbuffer().nbytes == 1000
+    tool.release()
+
+
+def test_process_image_encodes_only_current_image(screenshot_ocr, monkeypatch):
+    results = []
+    monkeypatch.setattr(
+        screenshot_ocr.ScreenshotTool,
+        "call_ocr_api",
+        lambda self, img_base64: results.append(img_base64),
+    )
+    tool = screenshot_ocr.ScreenshotTool()
+    tool.process_image(FakeImage(3000))
+    tool.process_image(FakeImage(3))
+    tool.release()
+
+    assert results[1] == "////"
+
+
+@pytest.fixture
+def rss(screenshot_ocr, monkeypatch):
+    """设置内存上限为200MB，返回可修改的模拟内存占用（MB）和重启记录"""
+    state = SimpleNamespace(rss_mb=100, restart=mock.Mock())
+    monkeypatch.setattr(screenshot_ocr, "MAX_RSS_MB", 200)
+    monkeypatch.setattr(screenshot_ocr, "_baseline_checked", True)
+    monkeypatch.setattr(
+        screenshot_ocr, "get_process_rss", lambda: state.rss_mb * 1024 * 1024
+    )
+    monkeypatch.setattr(screenshot_ocr, "restart_self", state.restart)
+    return state
+
+
+def test_check_memory_limit_restarts_over_ceiling(screenshot_ocr, rss):
+    rss.rss_mb = 300
+    screenshot_ocr.check_memory_limit()
+
+    rss.restart.assert_called_once_with()
+
+
+def test_check_memory_limit_below_ceiling(screenshot_ocr, rss):
+    screenshot_ocr.check_memory_limit()
+
+    rss.restart.assert_not_called()
+
+
+def test_check_memory_limit_disabled(screenshot_ocr, rss, monkeypatch):
+    monkeypatch.setattr(screenshot_ocr, "MAX_RSS_MB", 0)
+    rss.rss_mb = 10**6
+    screenshot_ocr.check_memory_limit()
+
+    rss.restart.assert_not_called()
+
+
+def test_first_capture_over_ceiling_disables_limit(screenshot_ocr, rss, monkeypatch):
+    monkeypatch.setattr(screenshot_ocr, "_baseline_checked", False)
+    rss.rss_mb = 300
+    screenshot_ocr.check_memory_limit()
+    screenshot_ocr.check_memory_limit()
+
+    rss.restart.assert_not_called()
+    assert screenshot_ocr.MAX_RSS_MB == 0
+
+
+def test_first_capture_under_ceiling_keeps_limit(screenshot_ocr, rss, monkeypatch):
+    monkeypatch.setattr(screenshot_ocr, "_baseline_checked", False)
+    screenshot_ocr.check_memory_limit()
+    rss.restart.assert_not_called()
+
+    rss.rss_mb = 300
+    screenshot_ocr.check_memory_limit()
+
+    rss.restart.assert_called_once_with()
+    assert screenshot_ocr.MAX_RSS_MB == 200
+
+
+@pytest.fixture
+def restart_env(screenshot_ocr, monkeypatch, tmp_path):
+    script = str(tmp_path / "screenshot_ocr.py")
+    env = SimpleNamespace(script=script, popen=mock.Mock(), exit=mock.Mock())
+    monkeypatch.setattr(sys, "argv", [script, "--delay", "1", "--max-rss-mb", "300"])
+    monkeypatch.setattr(screenshot_ocr.subprocess, "Popen", env.popen)
+    monkeypatch.setattr(screenshot_ocr.os, "_exit", env.exit)
+    monkeypatch.setattr(screenshot_ocr.logging, "shutdown", mock.Mock())
+    return env
+
+
+def test_restart_self_relaunches_with_same_args(screenshot_ocr, restart_env):
+    screenshot_ocr.restart_self()
+
+    restart_env.popen.assert_called_once_with(
+        [sys.executable, restart_env.script, "--delay", "1", "--max-rss-mb", "300"],
+        cwd=os.path.dirname(restart_env.script),
+    )
+    restart_env.exit.assert_called_once_with(0)
+
+
+def test_restart_self_keeps_running_when_popen_fails(screenshot_ocr, restart_env):
+    restart_env.popen.side_effect = OSError("spawn failed")
+
+    screenshot_ocr.restart_self()
+
+    restart_env.exit.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (300, 300),
+        (0, 0),
+        (True, None),
+        ("300", None),
+        (50, None),
+        (-1, None),
+    ],
+)
+def test_validate_max_rss_mb(screenshot_ocr, value, expected):
+    if expected is None:
+        expected = screenshot_ocr.DEFAULT_MAX_RSS_MB
+    assert screenshot_ocr.validate_max_rss_mb(value, "测试") == expected